@@ -14,10 +14,9 @@ import sys
 import yaml
 import signal
 import readline
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
-import subprocess
 import requests
 from rich.console import Console
 from rich.table import Table
@@ -189,26 +188,36 @@ class MCPToolManager:
         except Exception as e:
             return {"error": f"Tool call failed: {str(e)}"}
     
+    async def _run_command(self, cmd: List[str], on_line: Callable[[str], None],
+                           timeout: int = 60) -> Tuple[int, str, str]:
+        """Run a tool binary via the shared streaming helper, returning (returncode, stdout tail, stderr)"""
+        sys.path.append('mcp_tools')
+        from hcs_common import stream_command
+        
+        try:
+            return await stream_command(cmd, on_line, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{cmd[0]} timed out after {timeout} seconds")
+    
     async def _call_sherlock(self, username: str) -> Dict[str, Any]:
         """Call sherlock tool directly"""
         try:
+            import re
             cmd = ['sherlock', username, '--timeout', '10', '--print-found']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            accounts = []
+            profile_urls = []
             
-            if result.returncode == 0:
-                # Parse results and extract URLs
-                accounts = []
-                profile_urls = []
-                
-                for line in result.stdout.split('\n'):
-                    if 'http' in line and username in line:
-                        accounts.append(line.strip())
-                        # Extract URL from the line
-                        import re
-                        url_match = re.search(r'https?://[^\s]+', line)
-                        if url_match:
-                            profile_urls.append(url_match.group())
-                
+            def collect_account(line: str) -> None:
+                # Found accounts are reported as lines containing the profile URL
+                if 'http' in line and username in line:
+                    accounts.append(line.strip())
+                    url_match = re.search(r'https?://[^\s]+', line)
+                    if url_match:
+                        profile_urls.append(url_match.group())
+            
+            returncode, _, stderr = await self._run_command(cmd, collect_account, timeout=60)
+            
+            if returncode == 0:
                 return {
                     "tool": "sherlock",
                     "target": username,
@@ -220,7 +229,7 @@ class MCPToolManager:
                     "investigation_summary": f"Found {len(accounts)} accounts for '{username}'"
                 }
             else:
-                return {"tool": "sherlock", "status": "error", "error": result.stderr}
+                return {"tool": "sherlock", "status": "error", "error": stderr}
                 
         except Exception as e:
             return {"tool": "sherlock", "status": "error", "error": str(e)}
@@ -229,15 +238,16 @@ class MCPToolManager:
         """Call mosint tool directly"""
         try:
             cmd = ['mosint', email, '-v']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            output_lines = []
+            returncode, _, _ = await self._run_command(cmd, output_lines.append, timeout=60)
             
             return {
                 "tool": "mosint",
                 "target": email,
                 "target_type": "email",
-                "status": "success" if result.returncode == 0 else "error",
+                "status": "success" if returncode == 0 else "error",
                 "domain": email.split("@")[1] if "@" in email else None,
-                "raw_output": result.stdout,
+                "raw_output": "".join(output_lines),
                 "investigation_summary": f"Email intelligence completed for '{email}'"
             }
             
@@ -254,7 +264,10 @@ class MCPToolManager:
             
             # Initialize and call the scraper
             scraper_server = ProfileScraperMCPServer()
-            result = await scraper_server.scrape_sherlock_profiles(sherlock_results, max_profiles)
+            try:
+                result = await scraper_server.scrape_sherlock_profiles(sherlock_results, max_profiles)
+            finally:
+                await scraper_server.aclose()
             
             return result
             
@@ -271,7 +284,10 @@ class MCPToolManager:
             
             # Initialize and call the analyzer
             analyzer_server = LinkAnalyzerMCPServer()
-            result = await analyzer_server.analyze_link(url)
+            try:
+                result = await analyzer_server.analyze_link(url)
+            finally:
+                await analyzer_server.aclose()
             
             return result
             
@@ -284,20 +300,16 @@ class MCPToolManager:
             # Import the DuckDuckGo search server
             import sys
             sys.path.append('mcp_tools')
-            from duckduckgo_server import check_duckduckgo_available
+            from duckduckgo_server import check_duckduckgo_available, get_cached_results, cache_results, run_text_search
             
             if not check_duckduckgo_available():
                 return {"tool": "duckduckgo_search", "status": "error", "error": "duckduckgo_search not installed"}
             
-            from duckduckgo_search import DDGS
-            
-            with DDGS() as ddgs:
-                results = list(ddgs.text(
-                    keywords=query,
-                    region="us-en",
-                    safesearch="moderate",
-                    max_results=max_results
-                ))
+            cache_key = ("web", query, "us-en", "moderate", max_results)
+            results = get_cached_results(cache_key)
+            if results is None:
+                results = await asyncio.to_thread(run_text_search, query, "us-en", "moderate", max_results)
+                cache_results(cache_key, results)
             
             # Process results for OSINT analysis
             processed_results = []
@@ -328,19 +340,16 @@ class MCPToolManager:
             # Import the DuckDuckGo search server
             import sys
             sys.path.append('mcp_tools')
-            from duckduckgo_server import check_duckduckgo_available
+            from duckduckgo_server import check_duckduckgo_available, get_cached_results, cache_results, run_news_search
             
             if not check_duckduckgo_available():
                 return {"tool": "duckduckgo_search", "status": "error", "error": "duckduckgo_search not installed"}
             
-            from duckduckgo_search import DDGS
-            
-            with DDGS() as ddgs:
-                results = list(ddgs.news(
-                    keywords=query,
-                    region="us-en",
-                    max_results=max_results
-                ))
+            cache_key = ("news", query, "us-en", max_results)
+            results = get_cached_results(cache_key)
+            if results is None:
+                results = await asyncio.to_thread(run_news_search, query, "us-en", max_results)
+                cache_results(cache_key, results)
             
             # Process results for OSINT analysis
             processed_results = []
@@ -6,7 +6,8 @@ Part of Hostile Command Suite OSINT Package
 
 import json
 import asyncio
-from typing import Dict, List, Any
+import time
+from typing import Dict, List, Any, Optional
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
@@ -15,6 +16,11 @@ import mcp.types as types
 # Create MCP server instance
 server = Server("duckduckgo-search")
 
+# Recent search results, keyed by search type and parameters
+SEARCH_CACHE_TTL = 900  # seconds
+SEARCH_CACHE_MAX_ENTRIES = 256
+_search_cache: Dict[tuple, tuple] = {}
+
 def check_duckduckgo_available() -> bool:
     """Check if duckduckgo_search is installed and available"""
     try:
@@ -23,6 +29,48 @@ def check_duckduckgo_available() -> bool:
     except ImportError:
         return False
 
+def get_cached_results(key: tuple) -> Optional[List[Dict[str, Any]]]:
+    """Return cached search results for key if they have not expired"""
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    
+    cached_at, results = entry
+    if time.monotonic() - cached_at > SEARCH_CACHE_TTL:
+        del _search_cache[key]
+        return None
+    return results
+
+def cache_results(key: tuple, results: List[Dict[str, Any]]):
+    """Store search results, evicting the oldest entry when full"""
+    _search_cache.pop(key, None)
+    if len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+        del _search_cache[next(iter(_search_cache))]
+    _search_cache[key] = (time.monotonic(), results)
+
+def run_text_search(query: str, region: str, safesearch: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run a blocking DuckDuckGo web search"""
+    from duckduckgo_search import DDGS
+    
+    with DDGS() as ddgs:
+        return list(ddgs.text(
+            keywords=query,
+            region=region,
+            safesearch=safesearch,
+            max_results=max_results
+        ))
+
+def run_news_search(query: str, region: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run a blocking DuckDuckGo news search"""
+    from duckduckgo_search import DDGS
+    
+    with DDGS() as ddgs:
+        return list(ddgs.news(
+            keywords=query,
+            region=region,
+            max_results=max_results
+        ))
+
 @server.list_tools()
 async def handle_list_tools() -> List[types.Tool]:
     """List available DuckDuckGo search tools"""
@@ -125,15 +173,12 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
             }))]
         
         try:
-            from duckduckgo_search import DDGS
-            
-            with DDGS() as ddgs:
-                results = list(ddgs.text(
-                    keywords=query,
-                    region=region,
-                    safesearch=safesearch,
-                    max_results=max_results
-                ))
+            cache_key = ("web", query, region, safesearch, max_results)
+            results = get_cached_results(cache_key)
+            if results is None:
+                # Keep the event loop free while DuckDuckGo responds
+                results = await asyncio.to_thread(run_text_search, query, region, safesearch, max_results)
+                cache_results(cache_key, results)
             
             # Extract key information for OSINT analysis
             processed_results = []
@@ -184,14 +229,11 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
             }))]
         
         try:
-            from duckduckgo_search import DDGS
-            
-            with DDGS() as ddgs:
-                results = list(ddgs.news(
-                    keywords=query,
-                    region=region,
-                    max_results=max_results
-                ))
+            cache_key = ("news", query, region, max_results)
+            results = get_cached_results(cache_key)
+            if results is None:
+                results = await asyncio.to_thread(run_news_search, query, region, max_results)
+                cache_results(cache_key, results)
             
             # Extract key information
             processed_results = []
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the HCS MCP servers
+Part of Hostile Command Suite OSINT Package
+"""
+
+import asyncio
+import re
+import urllib.parse
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import aiohttp
+import orjson
+
+# Only the end of the tool output is returned as raw_output
+RAW_OUTPUT_TAIL_BYTES = 4096
+
+# Longest stdout line a tool may print; the default 64 KiB reader limit is too
+# small for verbose JSON output
+STREAM_LINE_LIMIT = 1024 * 1024
+
+# GitHub REST API, used instead of scraping for bare profile URLs
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_HEADERS = {"Accept": "application/vnd.github+json"}
+_GITHUB_PROFILE_PATH_RE = re.compile(r'^/([A-Za-z0-9][A-Za-z0-9-]{0,38})/?$')
+# Top-level github.com pages that look like usernames but are not profiles
+GITHUB_RESERVED_PATHS = {
+    "about", "collections", "contact", "enterprise", "explore", "features", "login",
+    "marketplace", "new", "notifications", "orgs", "pricing", "pulls", "search",
+    "settings", "signup", "sponsors", "topics", "trending"
+}
+
+def github_username(url: str) -> Optional[str]:
+    """Return the username when url is a bare github.com profile URL"""
+    parts = urllib.parse.urlsplit(url)
+    if parts.netloc.lower() not in ("github.com", "www.github.com") or parts.query:
+        return None
+
+    match = _GITHUB_PROFILE_PATH_RE.match(parts.path)
+    if not match or match.group(1).lower() in GITHUB_RESERVED_PATHS:
+        return None
+    return match.group(1)
+
+class HTTPClient:
+    """
+    Base for the scrapers: one lazily created, pooled aiohttp session
+
+    Subclasses set self.headers and self.timeout, and the connector's
+    connection_limit and connection_limit_per_host.
+    """
+    connection_limit: int
+    connection_limit_per_host: int
+    session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session lazily so it binds to the running event loop"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit,
+                                             limit_per_host=self.connection_limit_per_host,
+                                             ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self.session
+
+    async def aclose(self):
+        """Close the HTTP session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+async def fetch_github_json(session: aiohttp.ClientSession, path: str) -> Optional[Tuple[Any, int]]:
+    """
+    GET a GitHub REST API path, returning (decoded body, bytes read)
+
+    Returns None when the API cannot answer (unknown user, rate limit,
+    network error, malformed body) so callers can fall back to the HTML page.
+    """
+    try:
+        async with session.get(f"{GITHUB_API_URL}{path}", headers=GITHUB_API_HEADERS) as response:
+            if response.status != 200:
+                return None
+            body = await response.read()
+        return orjson.loads(body), len(body)
+    except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError):
+        return None
+
+def github_user_path(username: str) -> str:
+    """GitHub REST API path of a user"""
+    return f"/users/{urllib.parse.quote(username)}"
+
+def is_markup(content_type: str) -> bool:
+    """Whether a content type is worth parsing (HTML/XML, or unspecified)"""
+    content_type = content_type.lower()
+    return not content_type or 'html' in content_type or 'xml' in content_type
+
+async def read_body(response: aiohttp.ClientResponse, limit: int) -> bytes:
+    """Stream a response body, stopping after limit bytes so large pages are truncated"""
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(65536):
+        body += chunk
+        if len(body) >= limit:
+            del body[limit:]
+            break
+    return bytes(body)
+
+def to_json(data: Dict[str, Any], option: int = 0) -> str:
+    """Serialize a tool response compactly for the MCP text payload (option takes orjson.OPT_* flags)"""
+    return orjson.dumps(data, option=option).decode()
+
+async def stream_command(cmd: List[str], on_line: Callable[[str], None],
+                         timeout: int = 60) -> Tuple[int, str, str]:
+    """
+    Run a command without blocking the event loop, passing each stdout line to on_line
+
+    Output is parsed as it arrives rather than buffered; only the last
+    RAW_OUTPUT_TAIL_BYTES are kept. Returns (returncode, stdout tail, stderr).
+    The child is killed if the run times out, is cancelled or fails to read.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        limit=STREAM_LINE_LIMIT
+    )
+
+    async def read_stdout() -> bytes:
+        tail = bytearray()
+        async for line in proc.stdout:
+            on_line(line.decode('utf-8', errors='replace'))
+            tail += line
+            if len(tail) > 2 * RAW_OUTPUT_TAIL_BYTES:
+                del tail[:-RAW_OUTPUT_TAIL_BYTES]
+        return bytes(tail[-RAW_OUTPUT_TAIL_BYTES:])
+
+    async def run() -> Tuple[bytes, bytes]:
+        # stderr is drained alongside stdout so a full pipe cannot stall the child
+        output = await asyncio.gather(read_stdout(), proc.stderr.read())
+        await proc.wait()
+        return output
+
+    try:
+        stdout_tail, stderr = await asyncio.wait_for(run(), timeout=timeout)
+    finally:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+    return (proc.returncode, stdout_tail.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace'))
@@ -5,26 +5,177 @@ Deep analysis of URLs including GitHub profiles, social media, and generic web c
 """
 
 import asyncio
+import atexit
 import json
+import multiprocessing
+import os
 import re
+import sys
 import urllib.parse
-from typing import Dict, List, Any, Optional
-import requests
-from bs4 import BeautifulSoup
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Tuple
+import aiohttp
+import ahocorasick
+import orjson
+from selectolax.lexbor import LexborHTMLParser
+from hcs_common import (HTTPClient, fetch_github_json, github_user_path, github_username,
+                        is_markup, read_body, to_json)
 import time
 
-class LinkAnalyzer:
+# Patterns used by the analyzers, compiled once at import
+_RE_CONTRIB = re.compile(r'(\d+)\s+contributions')
+_RE_NON_NUMERIC = re.compile(r'[^\d.]')
+_RE_NON_DIGIT = re.compile(r'[^\d]')
+_RE_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,255}\.[A-Za-z]{2,24}\b')
+_RE_PHONE = re.compile(r'(?<!\d)(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)')
+_RE_GA = re.compile(r'google-analytics|gtag|ga\(')
+_RE_FBPIXEL = re.compile(r'facebook\.com/tr')
+_RE_JS_FRAMEWORK = re.compile(r'react|vue|angular', re.IGNORECASE)
+_RE_BLOG = re.compile(r'blog', re.IGNORECASE)
+
+JS_FRAMEWORK_NAMES = {"react": "React", "vue": "Vue.js", "angular": "Angular"}
+
+SECURITY_KEYWORDS = ["security", "pentesting", "red team", "blue team", "cybersecurity",
+                     "vulnerability", "exploit", "hacking", "malware", "forensics"]
+
+TECH_KEYWORDS = {
+    "web": ["web", "html", "css", "javascript", "react", "vue", "angular", "django", "flask"],
+    "mobile": ["android", "ios", "react-native", "flutter", "swift", "kotlin"],
+    "ai/ml": ["machine-learning", "ai", "neural", "tensorflow", "pytorch", "sklearn"],
+    "security": ["security", "pentest", "vulnerability", "exploit", "forensics"],
+    "devops": ["docker", "kubernetes", "ci", "cd", "terraform", "ansible"],
+    "blockchain": ["blockchain", "crypto", "bitcoin", "ethereum", "smart-contract"],
+    "systems": ["system", "kernel", "driver", "embedded", "firmware"]
+}
+
+# Social platforms with dedicated analyzers, matched in a single regex scan
+_PLATFORM_RE = re.compile(r'twitter\.com|x\.com|linkedin\.com|instagram\.com|mastodon')
+_SOCIAL_ANALYZERS = {
+    "twitter.com": "_analyze_twitter_profile",
+    "x.com": "_analyze_twitter_profile",
+    "linkedin.com": "_analyze_linkedin_profile",
+    "instagram.com": "_analyze_instagram_profile",
+    "mastodon": "_analyze_mastodon_profile"
+}
+
+# Every GitHub profile node the analyzer reads, fetched with a single query
+_GITHUB_PROFILE_SELECTOR = ", ".join([
+    "div.p-note.user-profile-bio", "span.p-label", "span.p-org", "a.Link--primary",
+    "div.Box-row", "div.js-yearly-contributions",
+    'a[href*="/followers"]', 'a[href*="/following"]', 'a[href^="/orgs/"]'
+])
+
+def _build_automaton(entries) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton from (keyword, value) pairs"""
+    automaton = ahocorasick.Automaton()
+    for keyword, value in entries:
+        automaton.add_word(keyword, value)
+    automaton.make_automaton()
+    return automaton
+
+# Keyword matchers, so each text is scanned once instead of once per keyword
+_SECURITY_AUTOMATON = _build_automaton((kw, kw) for kw in SECURITY_KEYWORDS)
+_TECH_AUTOMATON = _build_automaton(
+    (kw, category) for category, keywords in TECH_KEYWORDS.items() for kw in keywords
+)
+
+# Pages larger than this are truncated rather than read in full
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+# Recent successful analyses, keyed by normalized URL
+ANALYSIS_CACHE_TTL = 300  # seconds
+ANALYSIS_CACHE_MAX_ENTRIES = 1024
+_analysis_cache: Dict[str, tuple] = {}
+_analysis_cache_stats = {"hits": 0, "misses": 0}
+
+def _analysis_cache_key(url: str) -> str:
+    """Normalize a URL for cache lookups (case-insensitive scheme and host, no fragment)"""
+    parts = urllib.parse.urlsplit(url)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path}"
+    return f"{key}?{parts.query}" if parts.query else key
+
+def get_cached_analysis(url: str) -> Optional[Dict[str, Any]]:
+    """Return the cached analysis for url if it has not expired"""
+    key = _analysis_cache_key(url)
+    entry = _analysis_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= ANALYSIS_CACHE_TTL:
+        _analysis_cache_stats["hits"] += 1
+        return entry[1]
+    
+    _analysis_cache.pop(key, None)
+    _analysis_cache_stats["misses"] += 1
+    return None
+
+def is_analysis_cached(url: str) -> bool:
+    """Whether an unexpired analysis is cached for url, without counting a lookup"""
+    entry = _analysis_cache.get(_analysis_cache_key(url))
+    return entry is not None and time.monotonic() - entry[0] <= ANALYSIS_CACHE_TTL
+
+def cache_analysis(url: str, analysis: Dict[str, Any]):
+    """Store a successful analysis, evicting the oldest entry when full"""
+    if analysis.get("status") != "success":
+        return
+    
+    key = _analysis_cache_key(url)
+    _analysis_cache.pop(key, None)
+    if len(_analysis_cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+        del _analysis_cache[next(iter(_analysis_cache))]
+    _analysis_cache[key] = (time.monotonic(), analysis)
+
+class LinkAnalyzer(HTTPClient):
     """Analyzes URLs for detailed intelligence extraction"""
     
+    # One pooled connector for all analyses: keep-alive connections are
+    # reused per host and DNS lookups are cached across requests
+    connection_limit = 64
+    connection_limit_per_host = 8
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
         self.timeout = 15
         self.max_retries = 2
+        self.session: Optional[aiohttp.ClientSession] = None
     
-    def analyze_github_profile(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _index_github_profile(self, tree: LexborHTMLParser) -> Dict[str, List[Any]]:
+        """Collect the GitHub profile nodes in one document pass, keyed by role"""
+        nodes = {}
+        for node in tree.css(_GITHUB_PROFILE_SELECTOR):
+            classes = set((node.attributes.get("class") or "").split())
+            href = node.attributes.get("href") or ""
+            roles = []
+            
+            if node.tag == "div":
+                if {"p-note", "user-profile-bio"} <= classes:
+                    roles.append("bio")
+                if "Box-row" in classes:
+                    roles.append("repositories")
+                if "js-yearly-contributions" in classes:
+                    roles.append("contributions")
+            elif node.tag == "span":
+                if "p-label" in classes:
+                    roles.append("location")
+                if "p-org" in classes:
+                    roles.append("organization")
+            elif node.tag == "a":
+                if "Link--primary" in classes:
+                    roles.append("website")
+                if "/followers" in href:
+                    roles.append("followers")
+                if "/following" in href:
+                    roles.append("following")
+                if href.startswith("/orgs/"):
+                    roles.append("organizations")
+            
+            for role in roles:
+                nodes.setdefault(role, []).append(node)
+        
+        return nodes
+    
+    def analyze_github_profile(self, tree: LexborHTMLParser, url: str) -> Dict[str, Any]:
         """Deep analysis of GitHub profiles"""
         analysis = {
             "platform": "github",
@@ -38,98 +189,163 @@ class LinkAnalyzer:
         
         try:
             # Extract comprehensive profile information
+            nodes = self._index_github_profile(tree)
+            
+            def first(role):
+                found = nodes.get(role)
+                return found[0] if found else None
             
             # Bio and basic info
-            bio_elem = soup.find("div", class_="p-note user-profile-bio")
+            bio_elem = first("bio")
             if bio_elem:
-                analysis["bio"] = bio_elem.get_text().strip()
+                analysis["bio"] = bio_elem.text().strip()
             
             # Location
-            location_elem = soup.find("span", class_="p-label")
+            location_elem = first("location")
             if location_elem:
-                analysis["location"] = location_elem.get_text().strip()
+                analysis["location"] = location_elem.text().strip()
             
             # Company/Organization
-            company_elem = soup.find("span", class_="p-org")
+            company_elem = first("organization")
             if company_elem:
-                analysis["organization"] = company_elem.get_text().strip()
+                analysis["organization"] = company_elem.text().strip()
             
             # Website/Blog
-            website_elem = soup.find("a", class_="Link--primary")
-            if website_elem and website_elem.get("href"):
-                analysis["website"] = website_elem.get("href")
+            website_elem = first("website")
+            if website_elem and website_elem.attributes.get("href"):
+                analysis["website"] = website_elem.attributes["href"]
             
             # Repository information
-            repo_elements = soup.find_all("div", class_="Box-row")
+            repo_elements = nodes.get("repositories", [])
             for repo in repo_elements[:10]:  # Limit to top 10 repos
-                repo_name_elem = repo.find("a", {"itemprop": "name codeRepository"})
+                repo_name_elem = repo.css_first('a[itemprop="name codeRepository"]')
                 if repo_name_elem:
                     repo_info = {
-                        "name": repo_name_elem.get_text().strip(),
-                        "url": "https://github.com" + repo_name_elem.get("href", "")
+                        "name": repo_name_elem.text().strip(),
+                        "url": "https://github.com" + (repo_name_elem.attributes.get("href") or "")
                     }
                     
                     # Description
-                    desc_elem = repo.find("p", {"itemprop": "description"})
+                    desc_elem = repo.css_first('p[itemprop="description"]')
                     if desc_elem:
-                        repo_info["description"] = desc_elem.get_text().strip()
+                        repo_info["description"] = desc_elem.text().strip()
                     
                     # Language
-                    lang_elem = repo.find("span", {"itemprop": "programmingLanguage"})
+                    lang_elem = repo.css_first('span[itemprop="programmingLanguage"]')
                     if lang_elem:
-                        repo_info["language"] = lang_elem.get_text().strip()
+                        # Languages repeat across repositories and profiles, so share one copy
+                        repo_info["language"] = sys.intern(lang_elem.text().strip())
                     
                     # Stars
-                    star_elem = repo.find("a", href=re.compile(r"/stargazers"))
+                    star_elem = repo.css_first('a[href*="/stargazers"]')
                     if star_elem:
-                        star_text = star_elem.get_text().strip()
+                        star_text = star_elem.text().strip()
                         repo_info["stars"] = star_text
                     
                     analysis["repositories"].append(repo_info)
             
             # Activity metrics
-            contrib_elem = soup.find("div", class_="js-yearly-contributions")
+            contrib_elem = first("contributions")
             if contrib_elem:
-                contrib_text = contrib_elem.get_text()
+                contrib_text = contrib_elem.text()
                 # Extract contribution count
-                contrib_match = re.search(r'(\d+)\s+contributions', contrib_text)
+                contrib_match = _RE_CONTRIB.search(contrib_text)
                 if contrib_match:
                     analysis["activity_metrics"]["yearly_contributions"] = contrib_match.group(1)
             
             # Follower/Following counts
-            followers_elem = soup.find("a", href=re.compile(r"/followers"))
+            followers_elem = first("followers")
             if followers_elem:
-                followers_text = followers_elem.get_text().strip()
-                analysis["activity_metrics"]["followers"] = re.sub(r'[^\d.]', '', followers_text)
+                followers_text = followers_elem.text().strip()
+                analysis["activity_metrics"]["followers"] = _RE_NON_NUMERIC.sub('', followers_text)
             
-            following_elem = soup.find("a", href=re.compile(r"/following"))
+            following_elem = first("following")
             if following_elem:
-                following_text = following_elem.get_text().strip()
-                analysis["activity_metrics"]["following"] = re.sub(r'[^\d.]', '', following_text)
+                following_text = following_elem.text().strip()
+                analysis["activity_metrics"]["following"] = _RE_NON_NUMERIC.sub('', following_text)
             
             # Organizations
-            org_elements = soup.find_all("a", href=re.compile(r"^/orgs/"))
+            org_elements = nodes.get("organizations", [])
             for org in org_elements[:5]:  # Limit to 5 orgs
-                org_name = org.get("aria-label", "").replace("@", "")
+                org_name = sys.intern((org.attributes.get("aria-label") or "").replace("@", ""))
                 if org_name:
                     analysis["social_connections"].append({
                         "type": "organization",
                         "name": org_name,
-                        "url": "https://github.com" + org.get("href", "")
+                        "url": "https://github.com" + (org.attributes.get("href") or "")
                     })
             
-            # Security analysis
-            analysis["security_indicators"] = self._analyze_github_security(analysis)
+            self._assess_github_profile(analysis)
             
-            # Technical analysis from repositories
-            analysis["technical_info"] = self._analyze_technical_profile(analysis["repositories"])
+        except Exception as e:
+            analysis["extraction_error"] = str(e)
+        
+        return analysis
+    
+    def analyze_github_api(self, user: Dict[str, Any], repos: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analysis of a GitHub profile from REST API user and repository data"""
+        analysis = {
+            "platform": "github",
+            "profile_type": "developer",
+            "technical_info": {},
+            "repositories": [],
+            "activity_metrics": {},
+            "social_connections": [],
+            "security_indicators": {}
+        }
+        
+        try:
+            # Same keys the HTML scraper fills; empty API fields are left out
+            for field, key in (("bio", "bio"), ("location", "location"),
+                               ("company", "organization"), ("blog", "website")):
+                value = (user.get(field) or "").strip()
+                if value:
+                    analysis[key] = value
+            
+            for field in ("followers", "following", "public_repos"):
+                if user.get(field) is not None:
+                    analysis["activity_metrics"][field] = str(user[field])
+            
+            for repo in repos[:10]:  # Limit to top 10 repos
+                repo_info = {
+                    "name": repo.get("name", ""),
+                    "url": repo.get("html_url", "")
+                }
+                if repo.get("description"):
+                    repo_info["description"] = repo["description"].strip()
+                if repo.get("language"):
+                    repo_info["language"] = sys.intern(repo["language"])
+                repo_info["stars"] = str(repo.get("stargazers_count", 0))
+                
+                analysis["repositories"].append(repo_info)
+            
+            self._assess_github_profile(analysis)
             
         except Exception as e:
             analysis["extraction_error"] = str(e)
         
         return analysis
     
-    def _analyze_github_security(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_github_profile(self, analysis: Dict[str, Any]):
+        """Add the security and technical assessments to a GitHub profile analysis"""
+        # Both keyword scans below share one lowercased text per repository
+        repo_texts = self._repo_texts(analysis["repositories"])
+        
+        # Security analysis
+        analysis["security_indicators"] = self._analyze_github_security(analysis, repo_texts)
+        
+        # Technical analysis from repositories
+        analysis["technical_info"] = self._analyze_technical_profile(analysis["repositories"], repo_texts)
+    
+    def _repo_texts(self, repositories: List[Dict[str, Any]]) -> List[str]:
+        """Lowercased name and description of each repository for keyword matching"""
+        # Newline-joined so no keyword can match across name and description;
+        # the automatons are case-sensitive, so each text is folded once here
+        return [(repo.get("name", "") + "\n" + repo.get("description", "")).lower()
+                for repo in repositories]
+    
+    def _analyze_github_security(self, profile_data: Dict[str, Any],
+                                 repo_texts: Optional[List[str]] = None) -> Dict[str, Any]:
         """Analyze security aspects of GitHub profile"""
         security_analysis = {
             "risk_level": "LOW",
@@ -141,37 +357,36 @@ class LinkAnalyzer:
         try:
             # Check for security-related keywords in bio
             bio = profile_data.get("bio", "").lower()
-            security_keywords = ["security", "pentesting", "red team", "blue team", "cybersecurity", 
-                               "vulnerability", "exploit", "hacking", "malware", "forensics"]
-            
-            found_security_keywords = [kw for kw in security_keywords if kw in bio]
+            bio_matches = {kw for _, kw in _SECURITY_AUTOMATON.iter(bio)}
+            found_security_keywords = [kw for kw in SECURITY_KEYWORDS if kw in bio_matches]
             if found_security_keywords:
                 security_analysis["security_focus"] = found_security_keywords
                 security_analysis["positive_indicators"].append("Security professional background")
             
             # Analyze repository topics for security tools
             security_repos = []
-            for repo in profile_data.get("repositories", []):
-                repo_name = repo.get("name", "").lower()
-                repo_desc = repo.get("description", "").lower()
-                
-                if any(kw in repo_name or kw in repo_desc for kw in security_keywords):
+            repositories = profile_data.get("repositories", [])
+            if repo_texts is None:
+                repo_texts = self._repo_texts(repositories)
+            for repo, repo_text in zip(repositories, repo_texts):
+                if next(_SECURITY_AUTOMATON.iter(repo_text), None):
                     security_repos.append(repo["name"])
             
             if security_repos:
                 security_analysis["security_repositories"] = security_repos
                 security_analysis["positive_indicators"].append(f"Security-related repositories: {len(security_repos)}")
             
-            # Check activity level
-            yearly_contribs = profile_data.get("activity_metrics", {}).get("yearly_contributions", "0")
-            try:
-                contrib_count = int(yearly_contribs.replace(",", ""))
-                if contrib_count > 1000:
-                    security_analysis["positive_indicators"].append("High activity level (1000+ contributions)")
-                elif contrib_count < 50:
-                    security_analysis["security_concerns"].append("Low activity level")
-            except:
-                pass
+            # Check activity level (the REST API does not report contributions)
+            yearly_contribs = profile_data.get("activity_metrics", {}).get("yearly_contributions")
+            if yearly_contribs:
+                try:
+                    contrib_count = int(yearly_contribs.replace(",", ""))
+                    if contrib_count > 1000:
+                        security_analysis["positive_indicators"].append("High activity level (1000+ contributions)")
+                    elif contrib_count < 50:
+                        security_analysis["security_concerns"].append("Low activity level")
+                except ValueError:
+                    pass
             
             # Organization analysis
             orgs = profile_data.get("social_connections", [])
@@ -189,7 +404,8 @@ class LinkAnalyzer:
         
         return security_analysis
     
-    def _analyze_technical_profile(self, repositories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_technical_profile(self, repositories: List[Dict[str, Any]],
+                                   repo_texts: Optional[List[str]] = None) -> Dict[str, Any]:
         """Analyze technical capabilities from repositories"""
         tech_analysis = {
             "primary_languages": {},
@@ -200,34 +416,19 @@ class LinkAnalyzer:
         
         try:
             # Language frequency analysis
-            languages = {}
-            for repo in repositories:
-                lang = repo.get("language")
-                if lang:
-                    languages[lang] = languages.get(lang, 0) + 1
-            
-            # Sort by frequency
-            sorted_langs = sorted(languages.items(), key=lambda x: x[1], reverse=True)
-            tech_analysis["primary_languages"] = dict(sorted_langs[:5])
+            languages = Counter(repo["language"] for repo in repositories if repo.get("language"))
+            tech_analysis["primary_languages"] = dict(languages.most_common(5))
             
             # Technology stack analysis
-            tech_keywords = {
-                "web": ["web", "html", "css", "javascript", "react", "vue", "angular", "django", "flask"],
-                "mobile": ["android", "ios", "react-native", "flutter", "swift", "kotlin"],
-                "ai/ml": ["machine-learning", "ai", "neural", "tensorflow", "pytorch", "sklearn"],
-                "security": ["security", "pentest", "vulnerability", "exploit", "forensics"],
-                "devops": ["docker", "kubernetes", "ci", "cd", "terraform", "ansible"],
-                "blockchain": ["blockchain", "crypto", "bitcoin", "ethereum", "smart-contract"],
-                "systems": ["system", "kernel", "driver", "embedded", "firmware"]
-            }
+            if repo_texts is None:
+                repo_texts = self._repo_texts(repositories)
+            category_counts = {}
+            for repo_text in repo_texts:
+                for category in {category for _, category in _TECH_AUTOMATON.iter(repo_text)}:
+                    category_counts[category] = category_counts.get(category, 0) + 1
             
-            for category, keywords in tech_keywords.items():
-                category_count = 0
-                for repo in repositories:
-                    repo_text = (repo.get("name", "") + " " + repo.get("description", "")).lower()
-                    if any(kw in repo_text for kw in keywords):
-                        category_count += 1
-                
+            for category in TECH_KEYWORDS:
+                category_count = category_counts.get(category, 0)
                 if category_count > 0:
                     tech_analysis["expertise_areas"].append({
                         "area": category,
@@ -238,7 +439,7 @@ class LinkAnalyzer:
             for repo in repositories:
                 stars = repo.get("stars", "0")
                 try:
-                    star_count = int(re.sub(r'[^\d]', '', stars))
+                    star_count = int(_RE_NON_DIGIT.sub('', stars))
                     if star_count > 100:
                         tech_analysis["project_types"].append({
                             "name": repo.get("name"),
@@ -253,7 +454,7 @@ class LinkAnalyzer:
         
         return tech_analysis
     
-    def analyze_social_media_profile(self, soup: BeautifulSoup, url: str, platform: str) -> Dict[str, Any]:
+    def analyze_social_media_profile(self, tree: LexborHTMLParser, url: str, platform: str) -> Dict[str, Any]:
         """Analyze social media profiles"""
         analysis = {
             "platform": platform,
@@ -266,77 +467,70 @@ class LinkAnalyzer:
         
         try:
             # Extract platform-specific data based on URL
-            if "twitter.com" in url or "x.com" in url:
-                analysis.update(self._analyze_twitter_profile(soup))
-            elif "linkedin.com" in url:
-                analysis.update(self._analyze_linkedin_profile(soup))
-            elif "instagram.com" in url:
-                analysis.update(self._analyze_instagram_profile(soup))
-            elif "mastodon" in url:
-                analysis.update(self._analyze_mastodon_profile(soup))
-            else:
-                analysis.update(self._analyze_generic_social_profile(soup))
+            match = _PLATFORM_RE.search(url)
+            analyzer_name = _SOCIAL_ANALYZERS[match.group(0)] if match else "_analyze_generic_social_profile"
+            analysis.update(getattr(self, analyzer_name)(tree))
                 
         except Exception as e:
             analysis["extraction_error"] = str(e)
         
         return analysis
     
-    def _analyze_twitter_profile(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_twitter_profile(self, tree: LexborHTMLParser) -> Dict[str, Any]:
         """Analyze Twitter/X profiles"""
         twitter_data = {}
         
         # Bio extraction
-        bio_elem = soup.find(attrs={"data-testid": "UserDescription"})
+        bio_elem = tree.css_first('[data-testid="UserDescription"]')
         if bio_elem:
-            twitter_data["bio"] = bio_elem.get_text().strip()
+            twitter_data["bio"] = bio_elem.text().strip()
         
         # Follower metrics
-        following_elem = soup.find(attrs={"data-testid": "UserFollowing"})
+        following_elem = tree.css_first('[data-testid="UserFollowing"]')
         if following_elem:
-            twitter_data["following"] = following_elem.get_text().strip()
+            twitter_data["following"] = following_elem.text().strip()
         
-        followers_elem = soup.find(attrs={"data-testid": "UserFollowers"})
+        followers_elem = tree.css_first('[data-testid="UserFollowers"]')
         if followers_elem:
-            twitter_data["followers"] = followers_elem.get_text().strip()
+            twitter_data["followers"] = followers_elem.text().strip()
         
         # Location
-        location_elem = soup.find(attrs={"data-testid": "UserLocation"})
+        location_elem = tree.css_first('[data-testid="UserLocation"]')
         if location_elem:
-            twitter_data["location"] = location_elem.get_text().strip()
+            twitter_data["location"] = location_elem.text().strip()
         
         # Website
-        website_elem = soup.find(attrs={"data-testid": "UserUrl"})
+        website_elem = tree.css_first('[data-testid="UserUrl"]')
         if website_elem:
-            link = website_elem.find("a")
+            link = website_elem.css_first("a")
             if link:
-                twitter_data["website"] = link.get("href", "")
+                twitter_data["website"] = link.attributes.get("href") or ""
         
         return twitter_data
     
-    def _analyze_linkedin_profile(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_linkedin_profile(self, tree: LexborHTMLParser) -> Dict[str, Any]:
         """Analyze LinkedIn profiles"""
         linkedin_data = {}
         
         # Professional title
-        title_elem = soup.find("div", class_="text-body-medium")
+        title_elem = tree.css_first("div.text-body-medium")
         if title_elem:
-            linkedin_data["professional_title"] = title_elem.get_text().strip()
+            linkedin_data["professional_title"] = title_elem.text().strip()
         
         # Experience section
-        experience_section = soup.find("section", id="experience-section")
+        experience_section = tree.css_first("section#experience-section")
         if experience_section:
             positions = []
-            position_elems = experience_section.find_all("div", class_="pv-entity__summary-info")
+            position_elems = experience_section.css("div.pv-entity__summary-info")
             for pos in position_elems[:5]:  # Limit to 5 positions
                 position_data = {}
-                title_elem = pos.find("h3")
+                title_elem = pos.css_first("h3")
                 if title_elem:
-                    position_data["title"] = title_elem.get_text().strip()
+                    position_data["title"] = title_elem.text().strip()
                 
-                company_elem = pos.find("p", class_="pv-entity__secondary-title")
+                company_elem = pos.css_first("p.pv-entity__secondary-title")
                 if company_elem:
-                    position_data["company"] = company_elem.get_text().strip()
+                    position_data["company"] = company_elem.text().strip()
                 
                 if position_data:
                     positions.append(position_data)
@@ -345,15 +539,15 @@ class LinkAnalyzer:
         
         return linkedin_data
     
-    def _analyze_instagram_profile(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_instagram_profile(self, tree: LexborHTMLParser) -> Dict[str, Any]:
         """Analyze Instagram profiles"""
         instagram_data = {}
         
         # Look for JSON-LD data
-        script_tags = soup.find_all('script', type='application/ld+json')
+        script_tags = tree.css('script[type="application/ld+json"]')
         for script in script_tags:
             try:
-                json_data = json.loads(script.string)
+                json_data = json.loads(script.text())
                 if isinstance(json_data, dict):
                     instagram_data["display_name"] = json_data.get("name", "")
                     instagram_data["bio"] = json_data.get("description", "")
@@ -363,54 +557,54 @@ class LinkAnalyzer:
         
         return instagram_data
     
-    def _analyze_mastodon_profile(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_mastodon_profile(self, tree: LexborHTMLParser) -> Dict[str, Any]:
         """Analyze Mastodon profiles"""
         mastodon_data = {}
         
         # Display name
-        name_elem = soup.find("span", class_="p-name")
+        name_elem = tree.css_first("span.p-name")
         if name_elem:
-            mastodon_data["display_name"] = name_elem.get_text().strip()
+            mastodon_data["display_name"] = name_elem.text().strip()
         
         # Bio/Note
-        note_elem = soup.find("div", class_="account__header__content")
+        note_elem = tree.css_first("div.account__header__content")
         if note_elem:
-            mastodon_data["bio"] = note_elem.get_text().strip()
+            mastodon_data["bio"] = note_elem.text().strip()
         
         # Stats
-        stats_elems = soup.find_all("div", class_="counter")
+        stats_elems = tree.css("div.counter")
         for stat in stats_elems:
-            label_elem = stat.find("small")
-            value_elem = stat.find("span")
+            label_elem = stat.css_first("small")
+            value_elem = stat.css_first("span")
             if label_elem and value_elem:
-                label = label_elem.get_text().strip().lower()
-                value = value_elem.get_text().strip()
+                label = label_elem.text().strip().lower()
+                value = value_elem.text().strip()
                 mastodon_data[f"{label}_count"] = value
         
         return mastodon_data
     
-    def _analyze_generic_social_profile(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_generic_social_profile(self, tree: LexborHTMLParser) -> Dict[str, Any]:
         """Analyze generic social media profiles"""
         generic_data = {}
         
         # Try to extract common elements
-        title = soup.find("title")
+        title = tree.css_first("title")
         if title:
-            generic_data["page_title"] = title.get_text().strip()
+            generic_data["page_title"] = title.text().strip()
         
         # Look for meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
+        meta_desc = tree.css_first('meta[name="description"]')
         if meta_desc:
-            generic_data["description"] = meta_desc.get("content", "")
+            generic_data["description"] = meta_desc.attributes.get("content") or ""
         
         # Look for profile-like structures
-        profile_imgs = soup.find_all("img", class_=re.compile(r"profile|avatar|user"))
-        if profile_imgs:
+        profile_img = tree.css_first('img[class*="profile"], img[class*="avatar"], img[class*="user"]')
+        if profile_img:
             generic_data["has_profile_image"] = True
         
         return generic_data
     
-    def analyze_generic_website(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def analyze_generic_website(self, tree: LexborHTMLParser, url: str) -> Dict[str, Any]:
         """Analyze generic websites for intelligence"""
         analysis = {
             "platform": "generic_website",
@@ -422,24 +616,25 @@ class LinkAnalyzer:
         
         try:
             # Basic site information
-            title = soup.find("title")
+            title = tree.css_first("title")
             if title:
-                analysis["title"] = title.get_text().strip()
+                analysis["title"] = title.text().strip()
             
             # Meta information
-            meta_desc = soup.find("meta", attrs={"name": "description"})
+            meta_desc = tree.css_first('meta[name="description"]')
             if meta_desc:
-                analysis["description"] = meta_desc.get("content", "")
+                analysis["description"] = meta_desc.attributes.get("content") or ""
             
             # Determine site type
-            analysis["site_type"] = self._determine_site_type(soup, url)
+            analysis["site_type"] = self._determine_site_type(tree, url)
             
-            # Extract key content
-            content_analysis = self._analyze_website_content(soup)
+            # Extract key content (page text is shared with the technical checks)
+            page_text = self._get_text(tree)
+            content_analysis = self._analyze_website_content(tree, page_text)
             analysis["content_analysis"] = content_analysis
             
             # Technical indicators
-            tech_indicators = self._analyze_technical_indicators(soup)
+            tech_indicators = self._analyze_technical_indicators(tree, page_text)
             analysis["technical_indicators"] = tech_indicators
             
             # Determine intelligence value
@@ -450,49 +645,52 @@ class LinkAnalyzer:
         
         return analysis
     
-    def _determine_site_type(self, soup: BeautifulSoup, url: str) -> str:
+    def _get_text(self, tree: LexborHTMLParser) -> str:
+        """Extract readable page text, leaving out script and style contents"""
+        text_tree = tree.clone()
+        text_tree.strip_tags(["script", "style"])
+        return text_tree.text()
+    
+    def _determine_site_type(self, tree: LexborHTMLParser, url: str) -> str:
         """Determine the type of website"""
         
         # Check for common patterns
-        if "blog" in url.lower() or soup.find("article") or soup.find(class_=re.compile(r"blog|post")):
+        if _RE_BLOG.search(url) or tree.css_first('article, [class*="blog"], [class*="post"]'):
             return "blog"
-        elif soup.find("form", attrs={"action": re.compile(r"login|signin")}) or "login" in url:
+        elif tree.css_first('form[action*="login"], form[action*="signin"]') or "login" in url:
             return "login_page"
-        elif soup.find(class_=re.compile(r"portfolio|resume|cv")):
+        elif tree.css_first('[class*="portfolio"], [class*="resume"], [class*="cv"]'):
             return "portfolio"
-        elif soup.find(class_=re.compile(r"shop|cart|buy|price")):
+        elif tree.css_first('[class*="shop"], [class*="cart"], [class*="buy"], [class*="price"]'):
             return "ecommerce"
-        elif soup.find("form") and soup.find("input", type="email"):
+        elif tree.css_first("form") and tree.css_first('input[type="email"]'):
             return "contact_form"
-        elif len(soup.find_all("a")) > 50:  # Lots of links
+        elif len(tree.css("a")) > 50:  # Lots of links
             return "directory_listing"
         else:
             return "informational"
     
-    def _analyze_website_content(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_website_content(self, tree: LexborHTMLParser, text_content: str) -> Dict[str, Any]:
         """Analyze website content for intelligence"""
         content_analysis = {}
         
-        # Extract text content
-        text_content = soup.get_text()
         content_analysis["word_count"] = len(text_content.split())
         
         # Look for contact information
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text_content)
-        if emails:
-            content_analysis["email_addresses"] = list(set(emails))
+        if '@' in text_content:
+            emails = _RE_EMAIL.findall(text_content)
+            if emails:
+                content_analysis["email_addresses"] = list(set(emails))
         
         # Look for phone numbers
-        phone_pattern = r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text_content)
+        phones = _RE_PHONE.findall(text_content)
         if phones:
             content_analysis["phone_numbers"] = list(set(phones))
         
         # Extract links
         external_links = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href')
+        for link in tree.css('a[href]'):
+            href = link.attributes.get('href')
             if href and (href.startswith('http') and 'github.com' not in href):
                 external_links.append(href)
         
@@ -501,35 +699,36 @@ class LinkAnalyzer:
         
         return content_analysis
     
-    def _analyze_technical_indicators(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _analyze_technical_indicators(self, tree: LexborHTMLParser, page_text: str) -> Dict[str, Any]:
         """Analyze technical aspects of the website"""
         tech_indicators = {}
         
         # Check for common frameworks/CMS
-        if soup.find(attrs={"name": "generator"}):
-            generator = soup.find(attrs={"name": "generator"}).get("content", "")
+        generator_elem = tree.css_first('[name="generator"]')
+        if generator_elem:
+            generator = generator_elem.attributes.get("content") or ""
             tech_indicators["cms_framework"] = generator
         
-        # Look for JavaScript frameworks
-        scripts = soup.find_all('script')
+        # Look for JavaScript frameworks in script sources and inline code
         frameworks = []
-        for script in scripts:
-            script_content = str(script)
-            if 'react' in script_content.lower():
-                frameworks.append('React')
-            elif 'vue' in script_content.lower():
-                frameworks.append('Vue.js')
-            elif 'angular' in script_content.lower():
-                frameworks.append('Angular')
+        inline_scripts = []
+        for script in tree.css('script'):
+            inline_code = script.text()
+            inline_scripts.append(inline_code)
+            match = (_RE_JS_FRAMEWORK.search(script.attributes.get('src') or '')
+                     or _RE_JS_FRAMEWORK.search(inline_code))
+            if match:
+                frameworks.append(JS_FRAMEWORK_NAMES[match.group(0).lower()])
         
         if frameworks:
             tech_indicators["javascript_frameworks"] = list(set(frameworks))
         
-        # Check for analytics/tracking
+        # Check for analytics/tracking in page text and inline scripts
         tracking_services = []
-        if soup.find(string=re.compile(r'google-analytics|gtag|ga\(')):
+        script_text = "\n".join(inline_scripts)
+        if _RE_GA.search(page_text) or _RE_GA.search(script_text):
             tracking_services.append('Google Analytics')
-        if soup.find(string=re.compile(r'facebook\.com/tr')):
+        if _RE_FBPIXEL.search(page_text) or _RE_FBPIXEL.search(script_text):
             tracking_services.append('Facebook Pixel')
         
         if tracking_services:
@@ -564,63 +763,204 @@ class LinkAnalyzer:
         else:
             return "low"
     
-    async def analyze_url(self, url: str) -> Dict[str, Any]:
-        """Main method to analyze any URL"""
+    async def _read_body(self, response: aiohttp.ClientResponse) -> str:
+        """Stream and decode a response body, stopping at MAX_RESPONSE_BYTES"""
+        body = await read_body(response, MAX_RESPONSE_BYTES)
+        try:
+            return body.decode(response.charset or 'utf-8', errors='replace')
+        except LookupError:  # Unknown charset declared by the server
+            return body.decode('utf-8', errors='replace')
+    
+    async def fetch(self, url: str) -> Tuple[int, str, str]:
+        """
+        Fetch a URL with retry logic, returning (status code, body, content type)
+        
+        Bodies of non-HTML responses are not downloaded and are returned empty.
+        """
+        session = await self._get_session()
+        html, content_type = "", ""
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(url, allow_redirects=True) as response:
+                    status_code = response.status
+                    if status_code == 200:
+                        content_type = response.headers.get('content-type', '')
+                        if is_markup(content_type):
+                            html = await self._read_body(response)
+                        break
+                if status_code in [429, 503]:  # Rate limited
+                    if attempt < self.max_retries:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(1)
+                    continue
+                raise e
+        
+        return status_code, html, content_type
+
+    async def fetch_github_api(self, username: str) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], int]]:
+        """
+        Fetch a user and their recently updated repositories from the GitHub API
+        
+        Returns (user, repos, bytes read), or None when the user cannot be
+        fetched so callers can fall back to HTML; missing repos read as empty.
+        """
+        session = await self._get_session()
+        user_path = github_user_path(username)
+        user_data, repos_data = await asyncio.gather(
+            fetch_github_json(session, user_path),
+            fetch_github_json(session, f"{user_path}/repos?per_page=10&sort=updated")
+        )
+        if user_data is None:
+            return None
+        user, user_size = user_data
+        repos, repos_size = repos_data if repos_data is not None else ([], 0)
+        return user, repos, user_size + repos_size
+
+    async def warm_connections(self, urls: List[str], max_concurrent: int):
+        """
+        Resolve and connect to the origins a throttled batch will reach later
+
+        The first max_concurrent origins are fetched straight away and open
+        their own connections, so only the origins beyond them are warmed,
+        and nothing is done when the batch spans no more origins than that.
+        A HEAD request per origin fills the connector's DNS cache and leaves
+        a keep-alive (TLS) connection in the pool. Failures are ignored; the
+        real request reports them. Cached URLs and GitHub profiles (which
+        are fetched from the API, not their host) are left out.
+        """
+        origins = {}  # Insertion-ordered, in batch order
+        for url in urls:
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            try:
+                if is_analysis_cached(url) or github_username(url):
+                    continue
+                parts = urllib.parse.urlsplit(url)
+            except ValueError:  # Malformed URL; analyze_url reports it
+                continue
+            origins.setdefault(f"{parts.scheme}://{parts.netloc}/", None)
+        if len(origins) <= max_concurrent:
+            return
+
+        session = await self._get_session()
+        timeout = aiohttp.ClientTimeout(total=min(self.timeout, 5))
+
+        async def warm(origin):
+            try:
+                async with session.head(origin, allow_redirects=False, timeout=timeout):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+        await asyncio.gather(*(warm(origin) for origin in list(origins)[max_concurrent:]))
+
+    def analyze_html(self, html: str, url: str, content_type: str = "") -> Dict[str, Any]:
+        """Parse fetched HTML and run the analyzer matching its domain"""
+        # Parse HTML
+        tree = LexborHTMLParser(html)
+        
+        # Determine analysis type based on URL
+        parsed_url = urllib.parse.urlparse(url)
+        domain = parsed_url.netloc.lower()
+        
+        if "github.com" in domain:
+            analysis = self.analyze_github_profile(tree, url)
+        elif _PLATFORM_RE.search(domain):
+            platform = domain.replace("www.", "").split(".")[0]
+            analysis = self.analyze_social_media_profile(tree, url, platform)
+        else:
+            analysis = self.analyze_generic_website(tree, url)
+        
+        # Add common metadata
+        analysis.update({
+            "url": url,
+            "domain": domain,
+            "status": "success",
+            "accessible": True,
+            "response_size": len(html),
+            "content_type": content_type,
+            "analysis_timestamp": time.time()
+        })
+        
+        return analysis
+    
+    async def analyze_url(self, url: str, parse_workers: int = 0) -> Dict[str, Any]:
+        """
+        Main method to analyze any URL
+        
+        Args:
+            url: URL to analyze
+            parse_workers: When set, parsing and analysis run in the shared
+                process pool sized for this many concurrent parses; by default
+                they run inline on the event loop thread
+        """
         try:
             # Basic URL validation and cleanup
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
             
-            # Make request with retry logic
-            for attempt in range(self.max_retries + 1):
-                try:
-                    response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
-                    if response.status_code == 200:
-                        break
-                    elif response.status_code in [429, 503]:  # Rate limited
-                        if attempt < self.max_retries:
-                            time.sleep(2 ** attempt)
-                            continue
-                except requests.RequestException as e:
-                    if attempt < self.max_retries:
-                        time.sleep(1)
-                        continue
-                    raise e
+            cached = get_cached_analysis(url)
+            if cached is not None:
+                return cached
+            
+            # Bare GitHub profiles are analyzed from the API's user and repository
+            # JSON rather than the rendered page
+            username = github_username(url)
+            if username:
+                api_data = await self.fetch_github_api(username)
+                if api_data is not None:
+                    user, repos, response_size = api_data
+                    analysis = self.analyze_github_api(user, repos)
+                    analysis.update({
+                        "url": url,
+                        "domain": urllib.parse.urlsplit(url).netloc.lower(),
+                        "status": "success",
+                        "accessible": True,
+                        "response_size": response_size,
+                        "content_type": "application/json",
+                        "data_source": "github_api",
+                        "analysis_timestamp": time.time()
+                    })
+                    cache_analysis(url, analysis)
+                    return analysis
+            
+            status_code, html, content_type = await self.fetch(url)
             
-            if response.status_code != 200:
+            if status_code != 200:
                 return {
                     "url": url,
                     "status": "error",
-                    "error": f"HTTP {response.status_code}",
+                    "error": f"HTTP {status_code}",
                     "accessible": False
                 }
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Determine analysis type based on URL
-            parsed_url = urllib.parse.urlparse(url)
-            domain = parsed_url.netloc.lower()
+            if not is_markup(content_type):
+                return {
+                    "url": url,
+                    "status": "skipped",
+                    "reason": f"Non-HTML content type: {content_type}",
+                    "accessible": True,
+                    "content_type": content_type
+                }
             
-            if "github.com" in domain:
-                analysis = self.analyze_github_profile(soup, url)
-            elif any(social in domain for social in ["twitter.com", "x.com", "linkedin.com", "instagram.com", "mastodon"]):
-                platform = domain.replace("www.", "").split(".")[0]
-                analysis = self.analyze_social_media_profile(soup, url, platform)
+            if not parse_workers:
+                analysis = self.analyze_html(html, url, content_type)
             else:
-                analysis = self.analyze_generic_website(soup, url)
-            
-            # Add common metadata
-            analysis.update({
-                "url": url,
-                "domain": domain,
-                "status": "success",
-                "accessible": True,
-                "response_size": len(response.text),
-                "content_type": response.headers.get('content-type', ''),
-                "analysis_timestamp": time.time()
-            })
+                # Looked up just before submitting, so a pool replaced during
+                # the fetch is never used
+                pool = get_parse_pool(parse_workers)
+                loop = asyncio.get_running_loop()
+                try:
+                    analysis = await loop.run_in_executor(pool, parse_and_analyze, html, url, content_type)
+                except BrokenProcessPool:
+                    # A worker died; drop the pool so the next parse starts a fresh one
+                    discard_parse_pool(pool)
+                    analysis = self.analyze_html(html, url, content_type)
             
+            cache_analysis(url, analysis)
             return analysis
             
         except Exception as e:
@@ -631,6 +971,53 @@ class LinkAnalyzer:
                 "accessible": False
             }
 
+def parse_and_analyze(html: str, url: str, content_type: str = "") -> Dict[str, Any]:
+    """Analyze a fetched page; module-level so worker processes can run it"""
+    return LinkAnalyzer().analyze_html(html, url, content_type)
+
+# Parsing is CPU-bound, so batch analyses spread it across cores. The pool is
+# shared by every server instance, started on first batch use and only shut
+# down at exit (or when replaced). Workers are not forked from this process,
+# which by then runs aiohttp's resolver threads.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_workers = 0
+_PARSE_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+def get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Return the shared parse pool, starting it if needed
+    
+    The pool holds at most one worker per CPU. A batch that can run more
+    parses at once than the current pool has workers gets a larger pool;
+    the old one finishes the jobs already submitted to it.
+    """
+    global _parse_pool, _parse_pool_workers
+    workers = max(1, min(workers, os.cpu_count() or 1))
+    if _parse_pool is None or workers > _parse_pool_workers:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False)
+        _parse_pool = ProcessPoolExecutor(max_workers=workers, mp_context=_PARSE_POOL_CONTEXT)
+        _parse_pool_workers = workers
+    return _parse_pool
+
+def discard_parse_pool(pool: Executor) -> None:
+    """Shut down a broken pool if it is still the shared one"""
+    global _parse_pool, _parse_pool_workers
+    if pool is _parse_pool:
+        _parse_pool, _parse_pool_workers = None, 0
+    pool.shutdown(wait=False)
+
+def shutdown_parse_pool() -> None:
+    """Stop the shared parse pool's worker processes"""
+    global _parse_pool, _parse_pool_workers
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False)
+        _parse_pool, _parse_pool_workers = None, 0
+
+atexit.register(shutdown_parse_pool)
+
 # MCP Server Implementation
 class LinkAnalyzerMCPServer:
     """MCP Server for link analysis functionality"""
@@ -638,6 +1025,22 @@ class LinkAnalyzerMCPServer:
     def __init__(self):
         self.analyzer = LinkAnalyzer()
     
+    async def aclose(self):
+        """Release network resources held by the analyzer"""
+        await self.analyzer.aclose()
+    
+    def to_json(self, result: Dict[str, Any], option: int = 0) -> str:
+        """Serialize an analysis result to JSON text, allowing non-string dict keys"""
+        return to_json(result, option=orjson.OPT_NON_STR_KEYS | option)
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Report hit/miss counts and size of the shared analysis cache"""
+        return {
+            "hits": _analysis_cache_stats["hits"],
+            "misses": _analysis_cache_stats["misses"],
+            "entries": len(_analysis_cache)
+        }
+    
     async def analyze_link(self, url: str) -> Dict[str, Any]:
         """
         Analyze a single URL for intelligence gathering
@@ -673,14 +1076,22 @@ class LinkAnalyzerMCPServer:
             max_concurrent: Maximum concurrent requests
         """
         try:
+            # Pay DNS and TLS setup for hosts queued behind the semaphore while
+            # the first analyses run
+            warm_up = asyncio.create_task(self.analyzer.warm_connections(urls, max_concurrent))
+
             semaphore = asyncio.Semaphore(max_concurrent)
-            
+
             async def analyze_with_semaphore(url):
                 async with semaphore:
-                    return await self.analyzer.analyze_url(url)
+                    return await self.analyzer.analyze_url(url, parse_workers=max_concurrent)
             
             tasks = [analyze_with_semaphore(url) for url in urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                warm_up.cancel()
+                await asyncio.gather(warm_up, return_exceptions=True)
             
             # Process results
             processed_results = []
@@ -719,6 +1130,8 @@ class LinkAnalyzerMCPServer:
     
     def _generate_intelligence_summary(self, analysis: Dict[str, Any]) -> str:
         """Generate a human-readable intelligence summary"""
+        if analysis.get("status") == "skipped":
+            return f"Analysis skipped: {analysis.get('reason', 'unsupported content')}"
         if analysis.get("status") != "success":
             return f"Analysis failed: {analysis.get('error', 'Unknown error')}"
         
@@ -733,24 +1146,29 @@ class LinkAnalyzerMCPServer:
             
             summary_parts.append(f"GitHub profile with {len(repos)} repositories")
             
-            if activity.get("yearly_contributions"):
-                summary_parts.append(f"{activity['yearly_contributions']} yearly contributions")
+            contributions = activity.get("yearly_contributions")
+            if contributions:
+                summary_parts.append(f"{contributions} yearly contributions")
             
-            if security.get("security_focus"):
-                summary_parts.append(f"Security focus: {', '.join(security['security_focus'])}")
+            security_focus = security.get("security_focus")
+            if security_focus:
+                summary_parts.append(f"Security focus: {', '.join(security_focus)}")
             
-            if analysis.get("organization"):
-                summary_parts.append(f"Works at: {analysis['organization']}")
+            organization = analysis.get("organization")
+            if organization:
+                summary_parts.append(f"Works at: {organization}")
         
         elif platform in ["twitter", "linkedin", "instagram", "mastodon"]:
             # Social media summary
             summary_parts.append(f"{platform.title()} profile")
             
-            if analysis.get("bio"):
-                summary_parts.append(f"Bio: {analysis['bio'][:100]}...")
+            bio = analysis.get("bio")
+            if bio:
+                summary_parts.append(f"Bio: {bio[:100]}...")
             
-            if analysis.get("followers"):
-                summary_parts.append(f"Followers: {analysis['followers']}")
+            followers = analysis.get("followers")
+            if followers:
+                summary_parts.append(f"Followers: {followers}")
         
         else:
             # Generic website summary
@@ -760,9 +1178,9 @@ class LinkAnalyzerMCPServer:
             summary_parts.append(f"{site_type} website")
             summary_parts.append(f"Intelligence value: {intelligence_value}")
             
-            content = analysis.get("content_analysis", {})
-            if content.get("email_addresses"):
-                summary_parts.append(f"Found {len(content['email_addresses'])} email addresses")
+            emails = analysis.get("content_analysis", {}).get("email_addresses")
+            if emails:
+                summary_parts.append(f"Found {len(emails)} email addresses")
         
         return "; ".join(summary_parts) if summary_parts else "Basic website analysis completed"
     
@@ -770,11 +1188,12 @@ class LinkAnalyzerMCPServer:
         """Check if link analyzer is working"""
         try:
             # Test with a simple request
-            test_result = await self.analyzer.analyze_url("https://httpbin.org/get")
+            test_result = await self.analyzer.analyze_url("https://httpbin.org/html")
             return {
                 "tool": "link_analyzer",
                 "status": "operational",
-                "test_result": test_result.get("status") == "success"
+                "test_result": test_result.get("status") == "success",
+                "cache": self.get_cache_stats()
             }
         except Exception as e:
             return {
@@ -791,13 +1210,15 @@ if __name__ == "__main__":
         # Test with GitHub profile
         github_result = await server.analyze_link("https://github.com/torvalds")
         print("GitHub Analysis:")
-        print(json.dumps(github_result, indent=2))
+        print(server.to_json(github_result, orjson.OPT_INDENT_2))
         
         print("\n" + "="*50 + "\n")
         
         # Test with generic website
-        generic_result = await server.analyze_link("https://httpbin.org/get")
+        generic_result = await server.analyze_link("https://httpbin.org/html")
         print("Generic Website Analysis:")
-        print(json.dumps(generic_result, indent=2))
+        print(server.to_json(generic_result, orjson.OPT_INDENT_2))
+        
+        await server.aclose()
     
     asyncio.run(test_analyzer())
\ No newline at end of file
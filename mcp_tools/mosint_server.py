@@ -4,20 +4,22 @@ Mosint MCP Server - Email OSINT Tool
 Part of Hostile Command Suite OSINT Package
 """
 
-import subprocess
-import json
+import asyncio
+import functools
 import shutil
 from typing import Dict, List, Any
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
+from hcs_common import stream_command, to_json
 
 # Create MCP server instance
 server = Server("mosint-osint")
 
+@functools.lru_cache(maxsize=1)
 def check_mosint_available() -> bool:
-    """Check if mosint is installed and available"""
+    """Check if mosint is installed and available (cached; the status tool re-checks)"""
     return shutil.which("mosint") is not None
 
 @server.list_tools()
@@ -59,17 +61,18 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
     """Handle tool calls"""
     
     if name == "check_mosint_status":
+        check_mosint_available.cache_clear()
         available = check_mosint_available()
         status = "available" if available else "not found"
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=to_json({
                     "tool": "mosint",
                     "status": status,
                     "available": available,
                     "description": "Email OSINT and breach investigation"
-                }, indent=2)
+                })
             )
         ]
     
@@ -78,14 +81,14 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
         verbose = arguments.get("verbose", True)
         
         if not email:
-            return [types.TextContent(type="text", text=json.dumps({"error": "Email is required"}))]
+            return [types.TextContent(type="text", text=to_json({"error": "Email is required"}))]
         
         # Basic email validation
         if "@" not in email or "." not in email:
-            return [types.TextContent(type="text", text=json.dumps({"error": "Invalid email format"}))]
+            return [types.TextContent(type="text", text=to_json({"error": "Invalid email format"}))]
         
         if not check_mosint_available():
-            return [types.TextContent(type="text", text=json.dumps({"error": "Mosint not installed or not in PATH"}))]
+            return [types.TextContent(type="text", text=to_json({"error": "Mosint not installed or not in PATH"}))]
         
         try:
             # Run mosint with verbose output
@@ -93,45 +96,55 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
             if verbose:
                 cmd.append('-v')
             
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # Try to extract useful information from output as it arrives. The
+            # findings only appear in the text itself, so all of it is kept
+            indicators = {"potential_breach": False, "social_accounts_found": False}
+            output_lines = []
             
-            if result.returncode == 0:
+            def scan_line(line: str):
+                output_lines.append(line)
+                line = line.lower()
+                if "breach" in line or "compromised" in line:
+                    indicators["potential_breach"] = True
+                if "social" in line or "account" in line:
+                    indicators["social_accounts_found"] = True
+            
+            returncode, _, stderr = await stream_command(cmd, scan_line, timeout=60)
+            
+            if returncode == 0:
                 investigation_result = {
                     "tool": "mosint",
                     "target": email,
                     "target_type": "email",
                     "status": "success",
                     "domain": email.split("@")[1],
-                    "raw_output": result.stdout,
+                    "raw_output": "".join(output_lines),
                     "investigation_summary": f"Completed email intelligence gathering for '{email}'"
                 }
                 
-                # Try to extract useful information from output
-                output_lines = result.stdout.lower()
-                if "breach" in output_lines or "compromised" in output_lines:
-                    investigation_result["potential_breach"] = True
-                if "social" in output_lines or "account" in output_lines:
-                    investigation_result["social_accounts_found"] = True
+                for indicator, found in indicators.items():
+                    if found:
+                        investigation_result[indicator] = True
                     
             else:
                 investigation_result = {
                     "tool": "mosint",
                     "target": email,
                     "status": "error",
-                    "error": f"Mosint failed: {result.stderr}"
+                    "error": f"Mosint failed: {stderr}"
                 }
             
-            return [types.TextContent(type="text", text=json.dumps(investigation_result, indent=2))]
+            return [types.TextContent(type="text", text=to_json(investigation_result))]
             
-        except subprocess.TimeoutExpired:
-            return [types.TextContent(type="text", text=json.dumps({
+        except asyncio.TimeoutError:
+            return [types.TextContent(type="text", text=to_json({
                 "tool": "mosint",
                 "target": email,
                 "status": "error",
                 "error": "Investigation timed out"
             }))]
         except Exception as e:
-            return [types.TextContent(type="text", text=json.dumps({
+            return [types.TextContent(type="text", text=to_json({
                 "tool": "mosint",
                 "target": email,
                 "status": "error",
@@ -139,7 +152,7 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
             }))]
     
     else:
-        return [types.TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
+        return [types.TextContent(type="text", text=to_json({"error": f"Unknown tool: {name}"}))]
 
 async def main():
     # Run the server using stdin/stdout streams
@@ -158,5 +171,4 @@ async def main():
         )
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -5,34 +5,74 @@ Follows Sherlock links to extract profile information for OSINT investigations
 """
 
 import asyncio
-import json
+import codecs
 import re
 import urllib.parse
-from typing import Dict, List, Any, Optional
-import requests
-from bs4 import BeautifulSoup
-import time
+from typing import Dict, List, Any, Optional, Union
+import aiohttp
+import orjson
+from selectolax.lexbor import LexborHTMLParser
+from hcs_common import HTTPClient, fetch_github_json, github_user_path, github_username, is_markup, read_body
 
-class ProfileScraper:
+# Patterns used by the extractors, compiled once at import
+_NUM_RE = re.compile(r'[\d,]+')
+_KARMA_RE = re.compile(r'\d+\s+karma')
+_WORD_RE = re.compile(r'\S+')
+
+# Length of the page text kept in each profile
+TEXT_CONTENT_MAX_CHARS = 2000
+
+# Read limit for profile pages; the rest of a larger page is not downloaded
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+
+def _is_text(content_type: str) -> bool:
+    """Whether a non-markup content type still carries readable text (plain text, JSON)"""
+    content_type = content_type.lower()
+    return content_type.startswith('text/') or 'json' in content_type
+
+# Platform-specific extractors, keyed by domain; subdomains
+# (mobile.twitter.com, old.reddit.com, ...) resolve to their parent domain
+_PLATFORM_EXTRACTORS = {
+    "twitter.com": "_extract_twitter_data",
+    "x.com": "_extract_twitter_data",
+    "instagram.com": "_extract_instagram_data",
+    "github.com": "_extract_github_data",
+    "linkedin.com": "_extract_linkedin_data",
+    "facebook.com": "_extract_facebook_data",
+    "reddit.com": "_extract_reddit_data"
+}
+
+# Every GitHub profile node the extractor reads, fetched with a single query
+_GITHUB_PROFILE_SELECTOR = "span.p-name, div.p-note, span.p-label, span.Counter"
+
+def _platform_extractor(platform: str) -> str:
+    """Name of the ProfileScraper method that extracts data for a platform domain"""
+    extractor = _PLATFORM_EXTRACTORS.get(platform)
+    if extractor is None:
+        for domain, name in _PLATFORM_EXTRACTORS.items():
+            if platform.endswith("." + domain):
+                return name
+        return "_extract_generic_data"
+    return extractor
+
+class ProfileScraper(HTTPClient):
     """Scrapes profile pages found by Sherlock for additional intelligence"""
     
+    # Pooled connections are reused across profiles on the same host
+    connection_limit = 32
+    connection_limit_per_host = 2
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
         self.timeout = 10
         self.max_retries = 2
+        self.session: Optional[aiohttp.ClientSession] = None
     
-    def extract_profile_data(self, url: str, html: str, platform: str) -> Dict[str, Any]:
-        """Extract structured data from profile HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        profile_data = {
+    def _empty_profile(self, url: str, platform: str) -> Dict[str, Any]:
+        """Profile record with every field unset"""
+        return {
             "url": url,
             "platform": platform,
             "text_content": "",
@@ -47,175 +87,222 @@ class ProfileScraper:
             "location": "",
             "joined_date": ""
         }
+    
+    def extract_profile_data(self, url: str, html: Union[str, bytes], platform: str) -> Dict[str, Any]:
+        """Extract structured data from profile HTML (text, or raw bytes decoded by the parser)"""
+        tree = LexborHTMLParser(html, encoding=True)
+        profile_data = self._empty_profile(url, platform)
         
-        # Get clean text content
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        profile_data["text_content"] = ' '.join(chunk for chunk in chunks if chunk)[:2000]  # Limit to 2000 chars
+        # JSON-LD structured data lives in script tags, so read it before they go
+        json_ld = [script.text() for script in tree.css('script[type="application/ld+json"]')]
+        
+        # Remove script and style elements
+        tree.strip_tags(["script", "style"])
+        
+        # Page text, computed once and shared with the platform extractors
+        full_text = tree.root.text() if tree.root else ""
         
         # Platform-specific extraction
-        if "twitter.com" in url or "x.com" in url:
-            profile_data.update(self._extract_twitter_data(soup))
-        elif "instagram.com" in url:
-            profile_data.update(self._extract_instagram_data(soup))
-        elif "github.com" in url:
-            profile_data.update(self._extract_github_data(soup))
-        elif "linkedin.com" in url:
-            profile_data.update(self._extract_linkedin_data(soup))
-        elif "facebook.com" in url:
-            profile_data.update(self._extract_facebook_data(soup))
-        elif "reddit.com" in url:
-            profile_data.update(self._extract_reddit_data(soup))
-        else:
-            profile_data.update(self._extract_generic_data(soup))
+        extractor = getattr(self, _platform_extractor(platform))
+        profile_data.update(extractor(tree, full_text, json_ld))
+        
+        # Get clean text content, collapsing whitespace and stopping once enough is collected
+        words = []
+        total = 0
+        for word in _WORD_RE.finditer(full_text):
+            words.append(word.group())
+            total += len(words[-1]) + 1
+            if total > TEXT_CONTENT_MAX_CHARS:
+                break
+        profile_data["text_content"] = ' '.join(words)[:TEXT_CONTENT_MAX_CHARS]
         
         # Extract links
-        links = soup.find_all('a', href=True)
+        links = tree.css('a[href]')
         for link in links[:10]:  # Limit to first 10 links
-            href = link.get('href')
+            href = link.attributes.get('href')
             if href and (href.startswith('http') or href.startswith('www')):
                 profile_data["links"].append({
                     "url": href,
-                    "text": link.get_text().strip()[:100]
+                    "text": link.text().strip()[:100]
                 })
         
         return profile_data
     
-    def _extract_twitter_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_twitter_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract Twitter/X specific data"""
         data = {}
         
         # Display name
-        display_name_elem = soup.find(attrs={"data-testid": "UserName"})
+        display_name_elem = tree.css_first('[data-testid="UserName"]')
         if display_name_elem:
-            data["display_name"] = display_name_elem.get_text().strip()
+            data["display_name"] = display_name_elem.text().strip()
         
         # Bio
-        bio_elem = soup.find(attrs={"data-testid": "UserDescription"})
+        bio_elem = tree.css_first('[data-testid="UserDescription"]')
         if bio_elem:
-            data["bio"] = bio_elem.get_text().strip()
+            data["bio"] = bio_elem.text().strip()
         
         # Follower counts
-        following_elem = soup.find(attrs={"data-testid": "UserFollowing"})
+        following_elem = tree.css_first('[data-testid="UserFollowing"]')
         if following_elem:
-            text = following_elem.get_text()
-            numbers = re.findall(r'[\d,]+', text)
-            if numbers:
-                data["following_count"] = numbers[0].replace(',', '')
+            number = _NUM_RE.search(following_elem.text())
+            if number:
+                data["following_count"] = number.group().replace(',', '')
         
-        followers_elem = soup.find(attrs={"data-testid": "UserFollowers"})
+        followers_elem = tree.css_first('[data-testid="UserFollowers"]')
         if followers_elem:
-            text = followers_elem.get_text()
-            numbers = re.findall(r'[\d,]+', text)
-            if numbers:
-                data["follower_count"] = numbers[0].replace(',', '')
+            number = _NUM_RE.search(followers_elem.text())
+            if number:
+                data["follower_count"] = number.group().replace(',', '')
         
         # Verified status
-        verified_elem = soup.find(attrs={"data-testid": "icon-verified"})
+        verified_elem = tree.css_first('[data-testid="icon-verified"]')
         data["verified"] = verified_elem is not None
         
         return data
     
-    def _extract_instagram_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_instagram_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract Instagram specific data"""
         data = {}
         
-        # Look for JSON-LD data
-        script_tags = soup.find_all('script', type='application/ld+json')
-        for script in script_tags:
-            try:
-                json_data = json.loads(script.string)
-                if isinstance(json_data, dict):
-                    data["display_name"] = json_data.get("name", "")
-                    data["bio"] = json_data.get("description", "")
-            except:
-                pass
+        # Look for JSON-LD data, skipping blocks that cannot be a JSON document
+        blocks = [block for block in json_ld if block.lstrip()[:1] in ("{", "[")]
+        if not blocks:
+            return data
+        
+        # Parse every block in one call; a single malformed block spoils the
+        # batch, in which case they are parsed one by one
+        try:
+            documents = orjson.loads("[" + ",".join(blocks) + "]")
+        except orjson.JSONDecodeError:
+            documents = []
+            for block in blocks:
+                try:
+                    documents.append(orjson.loads(block))
+                except orjson.JSONDecodeError:
+                    continue
+        
+        for json_data in documents:
+            if isinstance(json_data, dict):
+                data["display_name"] = json_data.get("name", "")
+                data["bio"] = json_data.get("description", "")
+                if data["display_name"]:
+                    break
         
         return data
     
-    def _extract_github_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_github_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract GitHub specific data"""
         data = {}
         
-        # Display name
-        name_elem = soup.find("span", class_="p-name")
-        if name_elem:
-            data["display_name"] = name_elem.get_text().strip()
-        
-        # Bio
-        bio_elem = soup.find("div", class_="p-note")
-        if bio_elem:
-            data["bio"] = bio_elem.get_text().strip()
-        
-        # Location
-        location_elem = soup.find("span", class_="p-label")
-        if location_elem:
-            data["location"] = location_elem.get_text().strip()
-        
-        # Repository count
-        repo_elem = soup.find("span", class_="Counter")
-        if repo_elem:
-            data["post_count"] = repo_elem.get_text().strip()
+        # Display name, bio, location and repository count, in one document pass
+        fields = {("span", "p-name"): "display_name", ("div", "p-note"): "bio",
+                  ("span", "p-label"): "location", ("span", "Counter"): "post_count"}
+        for node in tree.css(_GITHUB_PROFILE_SELECTOR):
+            for css_class in (node.attributes.get("class") or "").split():
+                field = fields.get((node.tag, css_class))
+                if field and field not in data:
+                    data[field] = node.text().strip()
         
         return data
     
-    def _extract_linkedin_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_linkedin_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract LinkedIn specific data"""
         data = {}
         
         # Display name
-        h1_tags = soup.find_all("h1")
+        h1_tags = tree.css("h1")
         for h1 in h1_tags:
-            text = h1.get_text().strip()
+            text = h1.text().strip()
             if len(text) > 2 and len(text) < 100:
                 data["display_name"] = text
                 break
         
         return data
     
-    def _extract_facebook_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_facebook_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract Facebook specific data"""
         data = {}
         
         # Facebook often blocks scrapers, so limited extraction
-        title = soup.find("title")
+        title = tree.css_first("title")
         if title:
-            data["display_name"] = title.get_text().strip()
+            data["display_name"] = title.text().strip()
         
         return data
     
-    def _extract_reddit_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_reddit_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract Reddit specific data"""
         data = {}
         
-        # Post karma
-        karma_elements = soup.find_all(string=re.compile(r'\d+\s+karma'))
-        if karma_elements:
-            data["post_count"] = karma_elements[0].strip()
+        # Post karma, from one regex scan over the page text
+        karma = _KARMA_RE.search(full_text)
+        if karma:
+            data["post_count"] = karma.group()
         
         return data
     
-    def _extract_generic_data(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_generic_data(self, tree: LexborHTMLParser, full_text: str, json_ld: List[str]) -> Dict[str, Any]:
         """Extract generic profile data for unknown platforms"""
         data = {}
         
         # Try to find display name from title or h1
-        title = soup.find("title")
+        title = tree.css_first("title")
         if title:
-            data["display_name"] = title.get_text().strip()[:100]
+            data["display_name"] = title.text().strip()[:100]
         
-        h1 = soup.find("h1")
+        h1 = tree.css_first("h1")
         if h1 and not data.get("display_name"):
-            data["display_name"] = h1.get_text().strip()[:100]
+            data["display_name"] = h1.text().strip()[:100]
         
         # Look for bio in meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
+        meta_desc = tree.css_first('meta[name="description"]')
         if meta_desc:
-            data["bio"] = meta_desc.get("content", "")[:500]
+            data["bio"] = (meta_desc.attributes.get("content") or "")[:500]
         
         return data
     
+    def _decode_body(self, body: bytes, charset: Optional[str]) -> Union[str, bytes]:
+        """
+        Prepare a response body for parsing
+        
+        UTF-8 and undeclared bodies stay as bytes for the parser, which honours
+        any <meta charset>; only a non-UTF-8 charset from the HTTP header is
+        decoded here, since it takes precedence over the document's own.
+        """
+        if not charset:
+            return body
+        try:
+            if codecs.lookup(charset).name == 'utf-8':
+                return body
+            return body.decode(charset, errors='replace')
+        except LookupError:  # Unknown charset declared by the server
+            return body
+    
+    def extract_github_api_data(self, url: str, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a profile record from a GitHub REST API user object"""
+        profile_data = self._empty_profile(url, "github.com")
+        profile_data.update({
+            "text_content": user.get("bio") or "",
+            "bio": user.get("bio") or "",
+            "display_name": user.get("name") or "",
+            "location": user.get("location") or "",
+            "joined_date": user.get("created_at") or "",
+            "company": user.get("company") or ""
+        })
+        
+        for field, key in (("followers", "follower_count"), ("following", "following_count"),
+                           ("public_repos", "post_count")):
+            if user.get(field) is not None:
+                profile_data[key] = str(user[field])
+        
+        if user.get("blog"):
+            profile_data["links"].append({"url": user["blog"], "text": "blog"})
+        if user.get("avatar_url"):
+            profile_data["images"].append(user["avatar_url"])
+        
+        return profile_data
+    
     async def scrape_profile(self, url: str) -> Dict[str, Any]:
         """Scrape a single profile URL"""
         try:
@@ -224,43 +311,76 @@ class ProfileScraper:
                 url = 'https://' + url
             
             # Extract platform name
-            parsed_url = urllib.parse.urlparse(url)
-            platform = parsed_url.netloc.lower()
-            if platform.startswith('www.'):
-                platform = platform[4:]
+            parsed_url = urllib.parse.urlsplit(url)
+            platform = parsed_url.netloc.lower().removeprefix('www.')
+            
+            # Bare GitHub profiles are read from the API's user JSON instead of the page
+            username = github_username(url)
+            if username:
+                api_data = await fetch_github_json(await self._get_session(), github_user_path(username))
+                if api_data is not None:
+                    user, response_size = api_data
+                    profile_data = self.extract_github_api_data(url, user)
+                    profile_data.update({
+                        "status": "success",
+                        "accessible": True,
+                        "response_size": response_size,
+                        "content_type": "application/json",
+                        "data_source": "github_api"
+                    })
+                    return profile_data
             
             # Make request with retry logic
+            session = await self._get_session()
             for attempt in range(self.max_retries + 1):
                 try:
-                    response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
-                    if response.status_code == 200:
-                        break
-                    elif response.status_code in [429, 503]:  # Rate limited
+                    async with session.get(url, allow_redirects=True) as response:
+                        status_code = response.status
+                        if status_code == 200:
+                            content_type = response.headers.get('content-type', '')
+                            charset = response.charset
+                            # Only markup is parsed; other text keeps a short excerpt
+                            # and binary bodies (images, archives) are not downloaded
+                            if is_markup(content_type):
+                                body = await read_body(response, MAX_RESPONSE_BYTES)
+                            elif _is_text(content_type):
+                                body = await read_body(response, TEXT_CONTENT_MAX_CHARS * 4)
+                            else:
+                                body = b""
+                            break
+                    if status_code in [429, 503]:  # Rate limited
                         if attempt < self.max_retries:
-                            time.sleep(2 ** attempt)  # Exponential backoff
+                            await asyncio.sleep(2 ** attempt)  # Exponential backoff
                             continue
-                except requests.RequestException as e:
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                     if attempt < self.max_retries:
-                        time.sleep(1)
+                        await asyncio.sleep(1)
                         continue
                     raise e
             
-            if response.status_code != 200:
+            if status_code != 200:
                 return {
                     "url": url,
                     "platform": platform,
                     "status": "error",
-                    "error": f"HTTP {response.status_code}",
+                    "error": f"HTTP {status_code}",
                     "accessible": False
                 }
             
             # Extract profile data
-            profile_data = self.extract_profile_data(url, response.text, platform)
+            if is_markup(content_type):
+                profile_data = self.extract_profile_data(url, self._decode_body(body, charset), platform)
+            else:
+                profile_data = self._empty_profile(url, platform)
+                text = self._decode_body(body, charset)
+                if isinstance(text, bytes):
+                    text = text.decode('utf-8', errors='replace')
+                profile_data["text_content"] = text[:TEXT_CONTENT_MAX_CHARS]
             profile_data.update({
                 "status": "success",
                 "accessible": True,
-                "response_size": len(response.text),
-                "content_type": response.headers.get('content-type', '')
+                "response_size": len(body),
+                "content_type": content_type
             })
             
             return profile_data
@@ -276,29 +396,32 @@ class ProfileScraper:
     
     async def scrape_multiple_profiles(self, urls: List[str], max_concurrent: int = 3) -> List[Dict[str, Any]]:
         """Scrape multiple profile URLs with concurrency control"""
-        semaphore = asyncio.Semaphore(max_concurrent)
-        
-        async def scrape_with_semaphore(url):
-            async with semaphore:
-                return await self.scrape_profile(url)
-        
-        tasks = [scrape_with_semaphore(url) for url in urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle exceptions
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "url": urls[i],
-                    "status": "error",
-                    "error": str(result),
-                    "accessible": False
-                })
-            else:
-                processed_results.append(result)
-        
-        return processed_results
+        # A fixed pool of workers drains the queue, so only max_concurrent
+        # scrapes exist at a time however many URLs Sherlock found
+        queue = asyncio.Queue()
+        for index, url in enumerate(urls):
+            queue.put_nowait((index, url))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        
+        async def worker():
+            while True:
+                try:
+                    index, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await self.scrape_profile(url)
+                except Exception as e:
+                    results[index] = {
+                        "url": url,
+                        "status": "error",
+                        "error": str(e),
+                        "accessible": False
+                    }
+        
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(urls)))))
+        
+        return results
 
 # MCP Server Implementation
 class ProfileScraperMCPServer:
@@ -307,6 +430,10 @@ class ProfileScraperMCPServer:
     def __init__(self):
         self.scraper = ProfileScraper()
     
+    async def aclose(self):
+        """Release network resources held by the scraper"""
+        await self.scraper.aclose()
+    
     async def scrape_sherlock_profiles(self, sherlock_results: List[str], max_profiles: int = 5) -> Dict[str, Any]:
         """
         Scrape profiles found by Sherlock
@@ -364,7 +491,7 @@ class ProfileScraperMCPServer:
         """Check if profile scraper is working"""
         try:
             # Test with a simple request
-            test_result = await self.scraper.scrape_profile("https://httpbin.org/get")
+            test_result = await self.scraper.scrape_profile("https://httpbin.org/html")
             return {
                 "tool": "profile_scraper",
                 "status": "operational",
@@ -389,6 +516,8 @@ if __name__ == "__main__":
         ]
         
         result = await server.scrape_sherlock_profiles(test_urls, max_profiles=2)
-        print(json.dumps(result, indent=2))
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        
+        await server.aclose()
     
     asyncio.run(test_scraper())
\ No newline at end of file
@@ -4,20 +4,26 @@ Sherlock MCP Server - Username OSINT Tool
 Part of Hostile Command Suite OSINT Package
 """
 
-import subprocess
-import json
+import asyncio
+import functools
+import re
 import shutil
 from typing import Dict, List, Any
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
+from hcs_common import stream_command, to_json
 
 # Create MCP server instance
 server = Server("sherlock-osint")
 
+# Sherlock output lines that report a found account contain a profile URL
+_HTTP_LINE_RE = re.compile(r'https?://\S+')
+
+@functools.lru_cache(maxsize=1)
 def check_sherlock_available() -> bool:
-    """Check if sherlock is installed and available"""
+    """Check if sherlock is installed and available (cached; the status tool re-checks)"""
     return shutil.which("sherlock") is not None
 
 @server.list_tools()
@@ -59,17 +65,18 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
     """Handle tool calls"""
     
     if name == "check_sherlock_status":
+        check_sherlock_available.cache_clear()
         available = check_sherlock_available()
         status = "available" if available else "not found"
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps({
+                text=to_json({
                     "tool": "sherlock",
                     "status": status,
                     "available": available,
                     "description": "Username investigation across 400+ platforms"
-                }, indent=2)
+                })
             )
         ]
     
@@ -78,22 +85,24 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
         timeout = arguments.get("timeout", 10)
         
         if not username:
-            return [types.TextContent(type="text", text=json.dumps({"error": "Username is required"}))]
+            return [types.TextContent(type="text", text=to_json({"error": "Username is required"}))]
         
         if not check_sherlock_available():
-            return [types.TextContent(type="text", text=json.dumps({"error": "Sherlock not installed or not in PATH"}))]
+            return [types.TextContent(type="text", text=to_json({"error": "Sherlock not installed or not in PATH"}))]
         
         try:
             # Run sherlock with simple text output
             cmd = ['sherlock', username, '--timeout', str(timeout), '--print-found']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            # Parse accounts found as Sherlock reports them
+            accounts = []
+            
+            def collect_account(line: str):
+                if username in line and _HTTP_LINE_RE.search(line):
+                    accounts.append(line.strip())
+            
+            returncode, stdout_tail, stderr = await stream_command(cmd, collect_account, timeout=60)
             
-            if result.returncode == 0:
-                # Parse accounts found
-                accounts = []
-                for line in result.stdout.split('\n'):
-                    if 'http' in line and username in line:
-                        accounts.append(line.strip())
+            if returncode == 0:
                 
                 investigation_result = {
                     "tool": "sherlock",
@@ -102,7 +111,7 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
                     "status": "success",
                     "accounts_found": len(accounts),
                     "platforms": accounts,
-                    "raw_output": result.stdout,
+                    "raw_output": stdout_tail,
                     "investigation_summary": f"Found {len(accounts)} potential accounts for username '{username}' across social media platforms"
                 }
             else:
@@ -110,20 +119,20 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
                     "tool": "sherlock",
                     "target": username,
                     "status": "error",
-                    "error": f"Sherlock failed: {result.stderr}"
+                    "error": f"Sherlock failed: {stderr}"
                 }
             
-            return [types.TextContent(type="text", text=json.dumps(investigation_result, indent=2))]
+            return [types.TextContent(type="text", text=to_json(investigation_result))]
             
-        except subprocess.TimeoutExpired:
-            return [types.TextContent(type="text", text=json.dumps({
+        except asyncio.TimeoutError:
+            return [types.TextContent(type="text", text=to_json({
                 "tool": "sherlock",
                 "target": username,
                 "status": "error", 
                 "error": "Investigation timed out"
             }))]
         except Exception as e:
-            return [types.TextContent(type="text", text=json.dumps({
+            return [types.TextContent(type="text", text=to_json({
                 "tool": "sherlock",
                 "target": username,
                 "status": "error",
@@ -131,7 +140,7 @@ async def handle_call_tool(name: str, arguments: dict) -> List[types.TextContent
             }))]
     
     else:
-        return [types.TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
+        return [types.TextContent(type="text", text=to_json({"error": f"Unknown tool: {name}"}))]
 
 async def main():
     # Run the server using stdin/stdout streams
@@ -150,5 +159,4 @@ async def main():
         )
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file